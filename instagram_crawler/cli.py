@@ -13,6 +13,7 @@ from selenium import webdriver
 import pandas as pd
 import click
 
+import profile_screen
 import post_crawler
 
 
@@ -31,9 +32,16 @@ import post_crawler
     default=5,
     help='Number of processes to run while crawling a profile.'
 )
+@click.option(
+    '--cache-ttl',
+    '-t',
+    nargs=1,
+    default=profile_screen.CACHE_TTL,
+    help='Seconds to reuse cached profile info when screening profiles.'
+)
 
 
-def main(usernames, procs):
+def main(usernames, procs, cache_ttl):
     '''Crawl public Instagram profiles to collect post data.'''
 
     # GET USER INPUT FOR ARGUMENTS
@@ -67,6 +75,19 @@ def main(usernames, procs):
             'apps/cli_tools/python-instagram-crawler/output'
         )
 
+    # DROP PRIVATE, MISSING AND STALE PROFILES BEFORE CRAWLING
+    cache_path = os.path.join(
+        home_directory,
+        'apps/cli_tools/python-instagram-crawler/profile_cache.json'
+    )
+    usernames = profile_screen.screen_profiles(
+        usernames=list(usernames),
+        start_date=args['start_date'],
+        cache_path=cache_path,
+        cache_ttl=cache_ttl,
+        procs=procs
+    )
+
     # GET PHANTOMJS EXECUTABLE DIRECTORY
     executable_path = os.path.join(
         home_directory,
@@ -0,0 +1,219 @@
+from __future__ import print_function
+
+from multiprocessing import Process
+from multiprocessing import Manager
+import datetime as dt
+import random
+import json
+import time
+import sys
+import re
+import os
+
+from bs4 import BeautifulSoup
+import requests
+
+import post_crawler
+
+# URL TEMPLATE FOR PROFILE PAGES
+PROFILE_URL = 'https://www.instagram.com/{0}/'
+
+# DEFAULT NUMBER OF SECONDS A CACHED PROFILE IS CONSIDERED FRESH
+CACHE_TTL = 6 * 60 * 60
+
+
+def screen_profiles(usernames, start_date, cache_path, cache_ttl, procs,
+                    fetch=None):
+    '''checks all profiles over plain HTTP before crawling and
+    drops accounts that can't produce rows, keeping input order'''
+    print('\nscreening {0} profiles...'.format(len(usernames)))
+    fetch = fetch or chunk_fetch
+
+    # LOAD CACHED PROFILE INFO AND SPLIT OUT STALE OR MISSING ENTRIES
+    now = time.time()
+    cache = load_cache(cache_path, cache_ttl, now)
+    stale = [username for username in usernames if username not in cache]
+
+    # FETCH PROFILE INFO FOR STALE ENTRIES AND UPDATE CACHE.
+    # FAILED LOOKUPS AREN'T CACHED SO THEY'RE RETRIED NEXT RUN
+    fetched = fetch(stale, procs) if stale else {}
+    for username in fetched:
+        if fetched[username] and fetched[username]['exists'] is not None:
+            cache[username] = fetched[username]
+    if stale:
+        save_cache(cache_path, cache, cache_ttl, now)
+
+    # KEEP PROFILES THAT CAN PRODUCE ROWS. PROFILES WITH NO INFO
+    # (E.G. A FETCH PROCESS DIED) ARE LEFT TO THE CRAWLER
+    screened = []
+    for username in usernames:
+        info = fetched.get(username) or cache.get(username) or unchecked()
+        reason = skip_reason(info, start_date)
+        if reason:
+            print('skipping {0}: {1}'.format(username, reason))
+        else:
+            screened.append(username)
+
+    print('{0} of {1} profiles passed screening'
+          .format(len(screened), len(usernames)))
+    return screened
+
+
+def unchecked():
+    '''profile info for a profile that couldn't be checked'''
+    return {
+        'exists': None,
+        'is_private': None,
+        'post_count': None,
+        'last_post_timestamp': None,
+        'fetched_at': time.time()
+    }
+
+
+def skip_reason(info, start_date):
+    '''returns the reason a profile should be skipped
+    or None if it should be crawled'''
+
+    # PROFILE COULDN'T BE CHECKED, LEAVE IT TO THE CRAWLER
+    if info['exists'] is None:
+        return None
+    if not info['exists']:
+        return 'profile not found'
+    if info['is_private']:
+        return 'profile is private'
+    if not info['post_count']:
+        return 'profile has no posts'
+
+    # NEWEST POST IS OLDER THAN THE START DATE
+    last_post = info['last_post_timestamp']
+    if last_post is not None:
+        last_post_date = dt.datetime.fromtimestamp(last_post)
+        if last_post_date.date() < start_date.date():
+            return 'no posts since {0}'.format(last_post_date.date())
+    return None
+
+
+def chunk_fetch(usernames, num_processes):
+    '''splits usernames into chunks to be fetched in parallel'''
+
+    # MULTIPROCESSING DICT OBJECT FOR COLLECTING
+    # OUTPUT FROM MULTIPLE CONCURRENT PROCESSES
+    profiles = Manager().dict()
+
+    # CREATE GROUPS OF USERNAMES FOR EACH PROCESS
+    chunk_size = post_crawler.get_chunk_size(len(usernames), num_processes)
+    chunks = []
+    for i in xrange(0, len(usernames), chunk_size):
+        chunks.append(usernames[i:i + chunk_size])
+
+    # RUN FETCH FUNCTION IN SEPARATE
+    # PROCESS FOR EACH GROUP OF USERNAMES
+    jobs = []
+    for chunk in chunks:
+        process = Process(
+            target=fetch_profiles,
+            args=(chunk, profiles)
+        )
+        jobs.append(process)
+        process.start()
+
+    # WAIT UNTIL ALL PROCESSES IN JOBS
+    # LIST HAVE FINISHED TO CONTINUE
+    for job in jobs: job.join()
+    return dict(profiles)
+
+
+def fetch_profiles(usernames, profiles):
+    '''gets profile info for each username and adds
+    it to the multiprocessing manager dict'''
+    for username in usernames:
+        print('checking {0}...'.format(username), end='\r')
+        sys.stdout.flush()
+        profiles[username] = get_profile(username)
+
+
+def get_profile(username):
+    '''loads a profile page without a webdriver and pulls
+    the privacy flag, post count and newest post timestamp'''
+    info = unchecked()
+    try:
+        # RANDOM WAIT UP TO 1 SECOND
+        time.sleep(random.uniform(0.2, 1))
+
+        # SET RANDOM USER AGENT HEADER
+        headers = {'User-Agent': post_crawler.UA.random}
+
+        # SEND REQUEST. A 404 MEANS THE ACCOUNT
+        # WAS RENAMED OR DELETED
+        response = requests.get(
+            PROFILE_URL.format(username),
+            headers=headers,
+            timeout=30
+        )
+        if response.status_code == 404:
+            info['exists'] = False
+            return info
+        response.raise_for_status()
+
+        # GET SHARED DATA OBJECT
+        soup = BeautifulSoup(response.content, 'html.parser')
+        script = soup.find('script', text=re.compile('window._sharedData')).text
+        shared_data = json.loads(re.search(r'{.*}', script).group(0))
+
+        # PROFILE INFO LOCATED IN THE USER OBJECT IN SHARED DATA
+        user = shared_data['entry_data']['ProfilePage'][0]['graphql']['user']
+        media = user['edge_owner_to_timeline_media']
+        info['exists'] = True
+        info['is_private'] = user['is_private']
+        info['post_count'] = media['count']
+
+        # PINNED POSTS CAN BE LISTED BEFORE NEWER ONES SO TAKE THE
+        # LATEST TIMESTAMP. PRIVATE PROFILES DON'T INCLUDE ANY EDGES
+        if media['edges']:
+            info['last_post_timestamp'] = max(
+                edge['node']['taken_at_timestamp'] for edge in media['edges']
+            )
+
+    except Exception as e:
+        # LEAVE THE PROFILE UNCHECKED SO IT STILL GETS CRAWLED
+        print('error checking profile: {0}: {1}'.format(username, e))
+    return info
+
+
+def load_cache(path, cache_ttl, now):
+    '''loads cached profile info, dropping invalid and expired entries.
+    returns an empty cache if the file is missing or unreadable'''
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as json_file:
+            cache = json.load(json_file)
+    except (IOError, OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return prune_cache(cache, cache_ttl, now)
+
+
+def save_cache(path, cache, cache_ttl, now):
+    '''writes unexpired profile info to disk'''
+    try:
+        with open(path, 'w') as json_file:
+            json.dump(prune_cache(cache, cache_ttl, now), json_file)
+    except (IOError, OSError) as e:
+        print('error saving profile cache: {0}: {1}'.format(path, e))
+
+
+def prune_cache(cache, cache_ttl, now):
+    '''keeps well-formed entries fetched within the last cache_ttl seconds'''
+    pruned = {}
+    for username, info in cache.items():
+        if not isinstance(info, dict):
+            continue
+        if any(key not in info for key in unchecked()):
+            continue
+        if not isinstance(info['fetched_at'], (int, float)):
+            continue
+        if now - info['fetched_at'] <= cache_ttl:
+            pruned[username] = info
+    return pruned
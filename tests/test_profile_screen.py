@@ -0,0 +1,160 @@
+import datetime as dt
+import json
+import time
+import sys
+import os
+
+# MODULES IN THE PACKAGE USE IMPLICIT RELATIVE IMPORTS
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'instagram_crawler'
+))
+
+import profile_screen
+
+START_DATE = dt.datetime(2018, 6, 1)
+
+
+def profile(**kwargs):
+    '''builds profile info for an active public profile'''
+    info = {
+        'exists': True,
+        'is_private': False,
+        'post_count': 10,
+        'last_post_timestamp': time.mktime(dt.datetime(2018, 6, 15).timetuple()),
+        'fetched_at': time.time()
+    }
+    info.update(kwargs)
+    return info
+
+
+def fake_fetch(results):
+    '''returns a fetch function that records which usernames it was given'''
+    calls = []
+
+    def fetch(usernames, procs):
+        calls.append(list(usernames))
+        return dict((username, results[username])
+                    for username in usernames if username in results)
+    fetch.calls = calls
+    return fetch
+
+
+def test_skip_reason_unchecked():
+    assert profile_screen.skip_reason(profile_screen.unchecked(), START_DATE) is None
+
+
+def test_skip_reason_missing():
+    assert profile_screen.skip_reason(profile(exists=False), START_DATE) == 'profile not found'
+
+
+def test_skip_reason_private():
+    assert profile_screen.skip_reason(profile(is_private=True), START_DATE) == 'profile is private'
+
+
+def test_skip_reason_no_posts():
+    assert profile_screen.skip_reason(profile(post_count=0), START_DATE) == 'profile has no posts'
+
+
+def test_skip_reason_last_post_before_start_date():
+    last_post = time.mktime(dt.datetime(2018, 5, 31).timetuple())
+    reason = profile_screen.skip_reason(profile(last_post_timestamp=last_post), START_DATE)
+    assert reason == 'no posts since 2018-05-31'
+
+
+def test_skip_reason_last_post_on_start_date():
+    last_post = time.mktime(dt.datetime(2018, 6, 1, 12).timetuple())
+    assert profile_screen.skip_reason(profile(last_post_timestamp=last_post), START_DATE) is None
+
+
+def test_screen_profiles_keeps_input_order(tmpdir):
+    cache_path = str(tmpdir.join('profile_cache.json'))
+    fetch = fake_fetch({
+        'small': profile(post_count=1),
+        'private': profile(is_private=True),
+        'large': profile(post_count=1000)
+    })
+    screened = profile_screen.screen_profiles(
+        usernames=['small', 'private', 'large'],
+        start_date=START_DATE,
+        cache_path=cache_path,
+        cache_ttl=60,
+        procs=1,
+        fetch=fetch
+    )
+    assert screened == ['small', 'large']
+
+
+def test_screen_profiles_keeps_missing_results(tmpdir):
+    cache_path = str(tmpdir.join('profile_cache.json'))
+    screened = profile_screen.screen_profiles(
+        usernames=['dead_process'],
+        start_date=START_DATE,
+        cache_path=cache_path,
+        cache_ttl=60,
+        procs=1,
+        fetch=fake_fetch({})
+    )
+    assert screened == ['dead_process']
+
+
+def test_screen_profiles_does_not_cache_failed_lookups(tmpdir):
+    cache_path = str(tmpdir.join('profile_cache.json'))
+    fetch = fake_fetch({
+        'ok': profile(),
+        'failed': profile_screen.unchecked()
+    })
+    for _ in range(2):
+        screened = profile_screen.screen_profiles(
+            usernames=['ok', 'failed'],
+            start_date=START_DATE,
+            cache_path=cache_path,
+            cache_ttl=60,
+            procs=1,
+            fetch=fetch
+        )
+        assert screened == ['ok', 'failed']
+    assert fetch.calls == [['ok', 'failed'], ['failed']]
+    with open(cache_path) as json_file:
+        assert list(json.load(json_file)) == ['ok']
+
+
+def test_screen_profiles_refetches_expired_entries(tmpdir):
+    cache_path = str(tmpdir.join('profile_cache.json'))
+    with open(cache_path, 'w') as json_file:
+        json.dump({
+            'expired': profile(is_private=True, fetched_at=time.time() - 120),
+            'fresh': profile(is_private=True)
+        }, json_file)
+    fetch = fake_fetch({'expired': profile()})
+    screened = profile_screen.screen_profiles(
+        usernames=['expired', 'fresh'],
+        start_date=START_DATE,
+        cache_path=cache_path,
+        cache_ttl=60,
+        procs=1,
+        fetch=fetch
+    )
+    assert screened == ['expired']
+    assert fetch.calls == [['expired']]
+
+
+def test_load_cache_drops_invalid_and_expired_entries(tmpdir):
+    cache_path = str(tmpdir.join('profile_cache.json'))
+    now = time.time()
+    with open(cache_path, 'w') as json_file:
+        json.dump({
+            'fresh': profile(fetched_at=now),
+            'expired': profile(fetched_at=now - 120),
+            'no_timestamp': {'exists': True},
+            'not_a_dict': 5
+        }, json_file)
+    assert list(profile_screen.load_cache(cache_path, 60, now)) == ['fresh']
+
+
+def test_load_cache_ignores_invalid_files(tmpdir):
+    cache_path = str(tmpdir.join('profile_cache.json'))
+    for contents in ['not json', '[1, 2, 3]']:
+        with open(cache_path, 'w') as cache_file:
+            cache_file.write(contents)
+        assert profile_screen.load_cache(cache_path, 60, time.time()) == {}